@@ -3,9 +3,28 @@
 Test data generator - Creates sample product files for testing
 """
 
-import json
+import os
 from pathlib import Path
 
+from json_io import dump_json
+
+# Dummy file contents, built once and written with a single write() each
+BIN_BLOB = b'\x00' * 1024  # 1KB of zeros
+GLB_BLOB = b'glTF' + b'\x00' * 1020  # 1KB GLB file
+
+# A minimal PNG (1x1 pixel, black)
+PNG_BLOB = bytes([
+    0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A,  # PNG signature
+    0x00, 0x00, 0x00, 0x0D, 0x49, 0x48, 0x44, 0x52,  # IHDR chunk
+    0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01,  # 1x1 pixel
+    0x08, 0x02, 0x00, 0x00, 0x00, 0x90, 0x77, 0x53,
+    0xDE, 0x00, 0x00, 0x00, 0x0C, 0x49, 0x44, 0x41,
+    0x54, 0x08, 0xD7, 0x63, 0x60, 0x00, 0x00, 0x00,
+    0x02, 0x00, 0x01, 0xE2, 0x21, 0xBC, 0x33, 0x00,
+    0x00, 0x00, 0x00, 0x49, 0x45, 0x4E, 0x44, 0xAE,
+    0x42, 0x60, 0x82
+])
+
 
 def create_test_data():
     """Create sample product files for testing."""
@@ -26,18 +45,15 @@ def create_test_data():
         }
         
         gltf_path = test_dir / f"{product_id}_model.gltf"
-        with open(gltf_path, 'w') as f:
-            json.dump(gltf_content, f, indent=2)
+        dump_json(gltf_content, gltf_path)
         
         # Create dummy BIN file
         bin_path = test_dir / f"{product_id}_model.bin"
-        with open(bin_path, 'wb') as f:
-            f.write(b'\x00' * 1024)  # 1KB of zeros
+        bin_path.write_bytes(BIN_BLOB)
         
         # Create dummy GLB file
         glb_path = test_dir / f"{product_id}_model.glb"
-        with open(glb_path, 'wb') as f:
-            f.write(b'glTF' + b'\x00' * 1020)  # 1KB GLB file
+        glb_path.write_bytes(GLB_BLOB)
         
         # Create dummy texture files
         textures = [
@@ -48,25 +64,11 @@ def create_test_data():
         
         for texture_name in textures:
             texture_path = test_dir / texture_name
-            # Create a minimal PNG (1x1 pixel, black)
-            png_data = bytes([
-                0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A,  # PNG signature
-                0x00, 0x00, 0x00, 0x0D, 0x49, 0x48, 0x44, 0x52,  # IHDR chunk
-                0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01,  # 1x1 pixel
-                0x08, 0x02, 0x00, 0x00, 0x00, 0x90, 0x77, 0x53,
-                0xDE, 0x00, 0x00, 0x00, 0x0C, 0x49, 0x44, 0x41,
-                0x54, 0x08, 0xD7, 0x63, 0x60, 0x00, 0x00, 0x00,
-                0x02, 0x00, 0x01, 0xE2, 0x21, 0xBC, 0x33, 0x00,
-                0x00, 0x00, 0x00, 0x49, 0x45, 0x4E, 0x44, 0xAE,
-                0x42, 0x60, 0x82
-            ])
-            with open(texture_path, 'wb') as f:
-                f.write(png_data)
+            texture_path.write_bytes(PNG_BLOB)
         
         # Create dummy thumbnail
         thumbnail_path = test_dir / f"{product_id}_thumbnail.png"
-        with open(thumbnail_path, 'wb') as f:
-            f.write(png_data)  # Reuse the minimal PNG
+        thumbnail_path.write_bytes(PNG_BLOB)
         
         # Create dummy metadata (optional)
         metadata = {
@@ -76,13 +78,14 @@ def create_test_data():
             "category": "3D Models"
         }
         metadata_path = test_dir / f"{product_id}_metadata.json"
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        dump_json(metadata, metadata_path)
         
         print(f"✓ Created test files for {product_id}")
     
     print(f"\n✅ Test data created in: {test_dir.absolute()}")
-    print(f"Total files: {len(list(test_dir.iterdir()))}")
+    with os.scandir(test_dir) as entries:
+        total = sum(1 for _ in entries)
+    print(f"Total files: {total}")
     print("\nYou can now run the organizer script!")
 
 
@@ -0,0 +1,32 @@
+"""
+JSON file helpers shared by the organizer and the test data generator
+
+Uses orjson when it is installed and falls back to the stdlib json module.
+Importing this module has no side effects.
+"""
+
+import json
+from pathlib import Path
+
+# Optional: orjson is a much faster JSON encoder/decoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dump_json(obj, path):
+    """Write obj to path as indented JSON"""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2)
+
+
+def load_json(path):
+    """Read JSON from path"""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r') as f:
+        return json.load(f)
@@ -12,34 +12,139 @@ Structure for each product (e.g., OBC-005):
 """
 
 import os
-import json
+import re
+import errno
+import mmap
 import zipfile
 import shutil
 import logging
+from logging.handlers import RotatingFileHandler
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 import boto3
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 
+from json_io import dump_json, load_json
+
+# Optional: BLAKE3 is faster than the stdlib hashes for content hashing
+try:
+    from blake3 import blake3 as _content_hasher
+except ImportError:
+    from hashlib import blake2b as _content_hasher
+
 
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('product_organizer.log'),
+        RotatingFileHandler('product_organizer.log', maxBytes=10 * 1024 * 1024,
+                            backupCount=3, delay=True),
         logging.StreamHandler()
     ]
 )
 logger = logging.getLogger(__name__)
 
+# Filename patterns used to tell textures and thumbnails apart
+_TEXTURE_RE = re.compile(
+    r"(?:basecolor|normal|occlusion|roughness|metallic|orm|material)", re.IGNORECASE
+)
+_THUMB_RE = re.compile(r"thumb", re.IGNORECASE)
+
+# Buffer size for streaming file contents (1 MiB)
+_COPY_BUFSIZE = 1 << 20
+
+
+def _content_hash(path: str) -> str:
+    """
+    Hash a file's contents, prefixed with the hash algorithm name
+    
+    Example: blake3:af1349b9f5f9a1a6a0404dea36dcc949...
+    """
+    hasher = _content_hasher()
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                hasher.update(data)
+    return f"{hasher.name}:{hasher.hexdigest()}"
+
+
+def _write_to_zip(zipf: zipfile.ZipFile, src: str, arcname: str,
+                  compress_type: Optional[int] = None):
+    """
+    Stream a file into an open ZIP archive using large read buffers
+    
+    Equivalent to zipf.write(src, arcname, compress_type), which copies
+    in 8 KiB chunks.
+    """
+    zinfo = zipfile.ZipInfo.from_file(src, arcname)
+    zinfo.compress_type = zipf.compression if compress_type is None else compress_type
+    # ZipFile.open() takes the level from the ZipInfo, not the archive
+    # (ZipFile.write() sets it the same way). The attribute is public as
+    # compress_level from Python 3.13; older versions only have the private one.
+    if hasattr(zinfo, 'compress_level'):
+        zinfo.compress_level = zipf.compresslevel
+    else:
+        zinfo._compresslevel = zipf.compresslevel
+    
+    with open(src, 'rb', buffering=_COPY_BUFSIZE) as fsrc, zipf.open(zinfo, 'w') as fdst:
+        shutil.copyfileobj(fsrc, fdst, _COPY_BUFSIZE)
+
+
+def _fast_copy(src: str, dst: Path):
+    """
+    Copy src to dst without moving bytes through Python where possible
+    
+    Tries, in order: a hardlink (same filesystem, nothing copied), a
+    kernel-side os.copy_file_range (Linux; reflinks on btrfs/XFS), and
+    finally shutil.copy2, which itself copies with os.sendfile on Linux.
+    Outputs are written once, so sharing an inode with the source via a
+    hardlink is fine.
+    """
+    if os.path.lexists(dst):
+        # Already in place (e.g. source_dir is the output folder)
+        if os.path.exists(dst) and os.path.samefile(src, dst):
+            return
+        os.unlink(dst)
+    
+    try:
+        # Link the real file - os.link would hardlink a symlink itself
+        os.link(os.path.realpath(src), dst)
+        return
+    except OSError as e:
+        if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP):
+            raise
+    
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                # Preserve timestamps/permissions like copy2 does
+                shutil.copystat(src, dst)
+                return
+        except OSError:
+            pass
+    
+    shutil.copy2(src, dst)
+
 
 class ProductOrganizer:
     """Organizes product assets and uploads to S3"""
     
     def __init__(self, source_dir: str, output_dir: str, 
-                 s3_bucket: Optional[str] = None, s3_prefix: str = "products"):
+                 s3_bucket: Optional[str] = None, s3_prefix: str = "products",
+                 max_workers: int = 16):
         """
         Initialize organizer
         
@@ -48,17 +153,34 @@ class ProductOrganizer:
             output_dir: Directory for organized product folders
             s3_bucket: S3 bucket name (optional)
             s3_prefix: S3 path prefix (default: "products")
+            max_workers: Max products processed concurrently (default: 16)
         """
         self.source_dir = Path(source_dir)
         self.output_dir = Path(output_dir)
         self.s3_bucket = s3_bucket
         self.s3_prefix = s3_prefix
+        self.max_workers = max_workers
         
         # Initialize S3 client
         self.s3_client = None
+        self._transfer_cfg = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=16 * 1024 * 1024,
+            max_concurrency=10,
+            use_threads=True
+        )
         if s3_bucket:
             try:
-                self.s3_client = boto3.client('s3')
+                # One connection per transfer thread (_transfer_cfg
+                # max_concurrency) plus one per product worker for the HEAD
+                # checks in _pending_uploads, so nothing waits for a free
+                # connection
+                client_config = Config(
+                    max_pool_connections=self._transfer_cfg.max_concurrency + self.max_workers,
+                    retries={'mode': 'adaptive', 'max_attempts': 5},
+                    tcp_keepalive=True
+                )
+                self.s3_client = boto3.client('s3', config=client_config)
                 logger.info(f"✓ S3 client initialized for bucket: {s3_bucket}")
             except NoCredentialsError:
                 logger.error("AWS credentials not found! Please configure AWS credentials.")
@@ -76,6 +198,15 @@ class ProductOrganizer:
             'failed': 0,
             'uploaded': 0
         }
+        self._stats_lock = threading.Lock()
+        
+        # Timestamp shared by all products in a process_all run
+        self._run_ts = None
+    
+    def _increment_stat(self, key: str):
+        """Increment a stats counter; safe to call from worker threads"""
+        with self._stats_lock:
+            self.stats[key] += 1
     
     def extract_product_id(self, filename: str) -> str:
         """
@@ -91,7 +222,7 @@ class ProductOrganizer:
             return parts[0]
         return filename
     
-    def scan_products(self) -> Dict[str, Dict[str, List[Path]]]:
+    def scan_products(self) -> Dict[str, Dict[str, List[str]]]:
         """
         Scan source directory for product folders and group files by product ID
         
@@ -105,64 +236,81 @@ class ProductOrganizer:
         products = {}
         logger.info(f"Scanning directory: {self.source_dir}")
         
-        # Scan for product folders (first level subdirectories)
-        for product_folder in self.source_dir.iterdir():
-            if not product_folder.is_dir():
-                continue
-            
-            # Use folder name as product ID
-            product_id = product_folder.name
-            
-            # Initialize product entry
-            products[product_id] = {
-                'gltf': [],
-                'bin': [],
-                'textures': [],
-                'glb': [],
-                'thumbnail': [],
-                'json': []
-            }
-            
-            # Scan files within product folder
-            for file_path in product_folder.iterdir():
-                if not file_path.is_file():
+        # Scan for product folders (first level subdirectories).
+        # os.scandir reuses the file type from the directory read, so
+        # is_dir()/is_file() only cost an extra stat for symlinks, which
+        # are followed like Path.is_dir()/is_file() did.
+        with os.scandir(self.source_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir():
                     continue
                 
-                # Categorize file
-                ext = file_path.suffix.lower()
-                name_lower = file_path.stem.lower()
+                # Use folder name as product ID
+                product_id = entry.name
+                
+                # Initialize product entry (bound to a local so the per-file
+                # loop below doesn't look it up again)
+                files = products[product_id] = {
+                    'gltf': [],
+                    'bin': [],
+                    'textures': [],
+                    'glb': [],
+                    'thumbnail': [],
+                    'json': [],
+                    'jpg': []
+                }
                 
-                if ext == '.gltf':
-                    products[product_id]['gltf'].append(file_path)
-                elif ext == '.bin':
-                    products[product_id]['bin'].append(file_path)
-                elif ext == '.glb':
-                    products[product_id]['glb'].append(file_path)
-                elif ext == '.json':
-                    products[product_id]['json'].append(file_path)
-                elif ext == '.png' or ext == '.jpg':
-                    # Check if it's a texture or thumbnail
-                    texture_keywords = ['basecolor', 'normal', 'occlusion', 'roughness', 
-                                      'metallic', 'orm', 'material']
-                    is_texture = any(kw in name_lower for kw in texture_keywords)
-                    
-                    if 'thumbnail' in name_lower or 'thumb' in name_lower:
-                        products[product_id]['thumbnail'].append(file_path)
-                    elif is_texture:
-                        products[product_id]['textures'].append(file_path)
-                    else:
-                        # If no clear indication, check if we already have a thumbnail
-                        if not products[product_id]['thumbnail']:
-                            products[product_id]['thumbnail'].append(file_path)
-                        else:
-                            products[product_id]['textures'].append(file_path)
-        
-        self.stats['total'] = len(products)
+                # Scan files within product folder
+                with os.scandir(entry.path) as product_entries:
+                    for inner in product_entries:
+                        if not inner.is_file():
+                            continue
+                        
+                        # Categorize file
+                        name = inner.name
+                        ext = os.path.splitext(name)[1].lower()
+                        file_path = inner.path
+                        
+                        if ext == '.gltf':
+                            files['gltf'].append(file_path)
+                        elif ext == '.bin':
+                            files['bin'].append(file_path)
+                        elif ext == '.glb':
+                            files['glb'].append(file_path)
+                        elif ext == '.json':
+                            files['json'].append(file_path)
+                        elif ext == '.png' or ext == '.jpg':
+                            # Remember .jpg files as thumbnail fallback candidates
+                            if ext == '.jpg':
+                                files['jpg'].append(file_path)
+                            
+                            # Check if it's a texture or thumbnail. Only the
+                            # first 3 textures go into the ZIP, so stop there.
+                            if _THUMB_RE.search(name):
+                                files['thumbnail'].append(file_path)
+                            elif _TEXTURE_RE.search(name):
+                                if len(files['textures']) < 3:
+                                    files['textures'].append(file_path)
+                            else:
+                                # If no clear indication, check if we already have a thumbnail
+                                if not files['thumbnail']:
+                                    files['thumbnail'].append(file_path)
+                                elif len(files['textures']) < 3:
+                                    files['textures'].append(file_path)
+                        
+                        # Stop scanning once everything a product can use
+                        # has been found
+                        if (len(files['textures']) >= 3 and files['gltf'] and files['bin']
+                                and files['glb'] and files['thumbnail'] and files['json']):
+                            break
+        
+        with self._stats_lock:
+            self.stats['total'] = len(products)
         logger.info(f"Found {len(products)} product(s)")
         
         return products
     
-    def validate_product(self, product_id: str, files: Dict[str, List[Path]]) -> tuple:
+    def validate_product(self, product_id: str, files: Dict[str, List[str]]) -> tuple:
         """
         Validate product has required files
         
@@ -196,23 +344,28 @@ class ProductOrganizer:
         try:
             zip_path = product_folder / f"{product_id}.zip"
             
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            # Store entries by default - PNG textures are already compressed.
+            # Only .gltf/.bin are deflated, at the fastest level.
+            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_STORED, compresslevel=1) as zipf:
                 # Add .gltf file
                 if files['gltf']:
                     gltf_file = files['gltf'][0]
-                    zipf.write(gltf_file, gltf_file.name)
-                    logger.info(f"    Added to ZIP: {gltf_file.name}")
+                    gltf_name = os.path.basename(gltf_file)
+                    _write_to_zip(zipf, gltf_file, gltf_name, zipfile.ZIP_DEFLATED)
+                    logger.debug("    Added to ZIP: %s", gltf_name)
                 
                 # Add .bin file
                 if files['bin']:
                     bin_file = files['bin'][0]
-                    zipf.write(bin_file, bin_file.name)
-                    logger.info(f"    Added to ZIP: {bin_file.name}")
+                    bin_name = os.path.basename(bin_file)
+                    _write_to_zip(zipf, bin_file, bin_name, zipfile.ZIP_DEFLATED)
+                    logger.debug("    Added to ZIP: %s", bin_name)
                 
                 # Add 3 texture files
                 for i, texture in enumerate(files['textures'][:3], 1):
-                    zipf.write(texture, texture.name)
-                    logger.info(f"    Added to ZIP: {texture.name}")
+                    texture_name = os.path.basename(texture)
+                    _write_to_zip(zipf, texture, texture_name)
+                    logger.debug("    Added to ZIP: %s", texture_name)
             
             logger.info(f"  ✓ Created: {zip_path.name}")
             return True
@@ -225,33 +378,35 @@ class ProductOrganizer:
         """Create metadata JSON file"""
         metadata = {
             "product_id": product_id,
-            "created_at": datetime.now().isoformat(),
+            "created_at": self._run_ts or datetime.now(tz=timezone.utc).isoformat(),
             "files": {
                 "zip": f"{product_id}.zip",
                 "glb": f"{product_id}.glb",
                 "thumbnail": f"{product_id}_thumbnail.png"
             },
             "zip_contents": {
-                "gltf": files['gltf'][0].name if files['gltf'] else None,
-                "bin": files['bin'][0].name if files['bin'] else None,
-                "textures": [t.name for t in files['textures'][:3]]
+                "gltf": os.path.basename(files['gltf'][0]) if files['gltf'] else None,
+                "bin": os.path.basename(files['bin'][0]) if files['bin'] else None,
+                "textures": [os.path.basename(t) for t in files['textures'][:3]]
             },
             "status": "processed"
         }
         
-        # If original metadata exists, merge it
+        metadata_path = product_folder / f"{product_id}_metadata.json"
+        
+        # If original metadata exists, merge it - unless it is the output
+        # of a previous run (source_dir pointed at the output folder)
         if files['json']:
             try:
-                with open(files['json'][0], 'r') as f:
-                    original_metadata = json.load(f)
+                original_path = files['json'][0]
+                if not (metadata_path.exists() and os.path.samefile(original_path, metadata_path)):
+                    original_metadata = load_json(original_path)
                     metadata.update(original_metadata)
             except Exception as e:
                 logger.warning(f"  ⚠ Could not read original metadata: {e}")
         
         # Save metadata
-        metadata_path = product_folder / f"{product_id}_metadata.json"
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        dump_json(metadata, metadata_path)
         
         logger.info(f"  ✓ Created: {metadata_path.name}")
     
@@ -268,13 +423,13 @@ class ProductOrganizer:
         is_valid, issues = self.validate_product(product_id, files)
         
         if not is_valid:
-            logger.warning(f"  ⚠ Validation issues:")
-            for issue in issues:
-                logger.warning(f"    - {issue}")
+            # Single message per product - products are processed concurrently
+            issue_lines = "".join(f"\n    - {issue}" for issue in issues)
+            logger.warning(f"  ⚠ Validation issues for {product_id}:{issue_lines}")
             
             # Only skip if critical files are missing
             if not files['gltf'] or not files['bin'] or not files['glb']:
-                logger.error(f"  ✗ Skipping: Missing critical files")
+                logger.error(f"  ✗ Skipping {product_id}: Missing critical files")
                 return None
         
         # Create product folder
@@ -290,23 +445,20 @@ class ProductOrganizer:
         if files['glb']:
             glb_src = files['glb'][0]
             glb_dest = product_folder / f"{product_id}.glb"
-            shutil.copy2(glb_src, glb_dest)
+            _fast_copy(glb_src, glb_dest)
             logger.info(f"  ✓ Copied: {glb_dest.name}")
         
         # Copy thumbnail (use .png if available, otherwise .jpg)
         thumbnail_file = None
         if files['thumbnail']:
             thumbnail_file = files['thumbnail'][0]
-        else:
-            # Look for .jpg file as fallback
-            for file_path in (self.source_dir / product_id).iterdir():
-                if file_path.suffix.lower() == '.jpg':
-                    thumbnail_file = file_path
-                    break
+        elif files['jpg']:
+            # Use .jpg file found during the scan as fallback
+            thumbnail_file = files['jpg'][0]
         
         if thumbnail_file:
             thumb_dest = product_folder / f"{product_id}_thumbnail.png"
-            shutil.copy2(thumbnail_file, thumb_dest)
+            _fast_copy(thumbnail_file, thumb_dest)
             logger.info(f"  ✓ Copied: {thumb_dest.name}")
         
         # Create metadata
@@ -325,32 +477,163 @@ class ProductOrganizer:
             return False
         
         try:
-            uploaded_count = 0
+            pending = self._pending_uploads(product_folder, product_id)
+            with create_transfer_manager(self.s3_client, self._transfer_cfg) as transfer_manager:
+                uploads = self._submit_upload(transfer_manager, pending)
+                return self._wait_for_upload(product_id, uploads)
+        except Exception as e:
+            logger.error(f"  ✗ Unexpected error during upload: {e}")
+            return False
+    
+    def _pending_uploads(self, product_folder: Path, product_id: str) -> List[tuple]:
+        """
+        List the files in a product folder that need uploading
+        
+        Files already in S3 with identical contents are skipped. This hashes
+        every file and issues a HEAD request per file, so it runs in the
+        product worker threads rather than on the main thread.
+        
+        Returns:
+            List of (file_path, s3_key, content_hash) tuples
+        """
+        with os.scandir(product_folder) as entries:
+            file_paths = [entry.path for entry in entries if entry.is_file(follow_symlinks=False)]
+        
+        pending = []
+        for file_path in file_paths:
+            # Construct S3 key
+            s3_key = f"{self.s3_prefix}/{product_id}/{os.path.basename(file_path)}"
             
-            for file_path in product_folder.iterdir():
-                if file_path.is_file():
-                    # Construct S3 key
-                    s3_key = f"{self.s3_prefix}/{product_id}/{file_path.name}"
-                    
-                    # Upload file
-                    self.s3_client.upload_file(
-                        str(file_path),
-                        self.s3_bucket,
-                        s3_key
-                    )
-                    uploaded_count += 1
-                    logger.info(f"  ☁ Uploaded: s3://{self.s3_bucket}/{s3_key}")
+            # Skip files that are already in S3 with identical contents
+            content_hash = _content_hash(file_path)
+            if self._is_uploaded(s3_key, content_hash):
+                logger.debug("  ☁ Unchanged: s3://%s/%s", self.s3_bucket, s3_key)
+                continue
             
-            logger.info(f"  ✓ Uploaded {uploaded_count} file(s) to S3")
+            pending.append((file_path, s3_key, content_hash))
+        
+        return pending
+    
+    def _submit_upload(self, transfer_manager, pending: List[tuple]) -> List[tuple]:
+        """
+        Queue files from _pending_uploads on the given transfer manager
+        
+        Returns:
+            List of (s3_key, transfer_future) pairs
+        """
+        uploads = []
+        for file_path, s3_key, content_hash in pending:
+            future = transfer_manager.upload(
+                file_path,
+                self.s3_bucket,
+                s3_key,
+                extra_args={'Metadata': {'content-hash': content_hash}}
+            )
+            uploads.append((s3_key, future))
+        
+        return uploads
+    
+    def _is_uploaded(self, s3_key: str, content_hash: str) -> bool:
+        """Check whether s3_key already exists with the given content hash"""
+        try:
+            response = self.s3_client.head_object(Bucket=self.s3_bucket, Key=s3_key)
+        except ClientError:
+            # Missing (or unreadable) object - upload it
+            return False
+        
+        return response.get('Metadata', {}).get('content-hash') == content_hash
+    
+    def _wait_for_upload(self, product_id: str, uploads: List[tuple]) -> bool:
+        """
+        Wait for a product's queued uploads to finish
+        
+        Returns:
+            True if every file was uploaded
+        """
+        try:
+            for s3_key, future in uploads:
+                future.result()
+                logger.debug("  ☁ Uploaded: s3://%s/%s", self.s3_bucket, s3_key)
+            
+            logger.info(f"  ✓ Uploaded {len(uploads)} file(s) to S3 for {product_id}")
             return True
             
         except ClientError as e:
-            logger.error(f"  ✗ S3 upload failed: {e}")
+            logger.error(f"  ✗ S3 upload failed for {product_id}: {e}")
             return False
         except Exception as e:
-            logger.error(f"  ✗ Unexpected error during upload: {e}")
+            logger.error(f"  ✗ Unexpected error during upload of {product_id}: {e}")
             return False
     
+    def _process_and_check(self, product_id: str, files: Dict, check_uploads: bool) -> tuple:
+        """
+        Process a single product and work out which of its files need uploading
+        
+        Returns:
+            (product_folder, pending) - pending is None when uploads are
+            disabled or the upload check failed
+        """
+        product_folder = self.process_product(product_id, files)
+        if not product_folder or not check_uploads:
+            return (product_folder, None)
+        
+        try:
+            pending = self._pending_uploads(product_folder, product_id)
+        except ClientError as e:
+            logger.error(f"  ✗ S3 upload failed for {product_id}: {e}")
+            return (product_folder, None)
+        except Exception as e:
+            logger.error(f"  ✗ Unexpected error during upload of {product_id}: {e}")
+            return (product_folder, None)
+        
+        return (product_folder, pending)
+    
+    def _process_products(self, products: Dict[str, Dict[str, List[str]]], transfer_manager):
+        """
+        Process products concurrently and queue their uploads
+        
+        Args:
+            products: Categorized files per product, from scan_products
+            transfer_manager: Transfer manager to upload with, or None to skip uploads
+        """
+        # Process products concurrently - the work is mostly file and
+        # network I/O, which releases the GIL. Uploads are queued as soon
+        # as a product is ready, so they overlap with the remaining work.
+        uploads = {}
+        check_uploads = transfer_manager is not None
+        workers = max(1, min(self.max_workers, len(products)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._process_and_check, product_id, files, check_uploads): product_id
+                for product_id, files in products.items()
+            }
+            
+            for future in as_completed(futures):
+                product_id = futures[future]
+                try:
+                    product_folder, pending = future.result()
+                except Exception as e:
+                    logger.error(f"  ✗ Unexpected error processing {product_id}: {e}")
+                    product_folder, pending = None, None
+                
+                if not product_folder:
+                    self._increment_stat('failed')
+                    continue
+                
+                self._increment_stat('success')
+                
+                # Queue upload to S3 if enabled
+                if pending is not None:
+                    try:
+                        uploads[product_id] = self._submit_upload(transfer_manager, pending)
+                    except Exception as e:
+                        logger.error(f"  ✗ Unexpected error during upload of {product_id}: {e}")
+        
+        # Wait for queued uploads
+        for product_id, product_uploads in uploads.items():
+            if self._wait_for_upload(product_id, product_uploads):
+                self._increment_stat('uploaded')
+    
     def process_all(self, upload_s3: bool = True):
         """
         Main processing function
@@ -362,6 +645,8 @@ class ProductOrganizer:
         logger.info("PRODUCT ASSET ORGANIZER")
         logger.info("=" * 70)
         
+        self._run_ts = datetime.now(tz=timezone.utc).isoformat()
+        
         # Scan products
         products = self.scan_products()
         
@@ -369,19 +654,13 @@ class ProductOrganizer:
             logger.warning("No products found!")
             return
         
-        # Process each product
-        for product_id, files in products.items():
-            product_folder = self.process_product(product_id, files)
-            
-            if product_folder:
-                self.stats['success'] += 1
-                
-                # Upload to S3 if enabled
-                if upload_s3 and self.s3_client:
-                    if self.upload_to_s3(product_folder, product_id):
-                        self.stats['uploaded'] += 1
-            else:
-                self.stats['failed'] += 1
+        # One transfer manager is shared by all uploads, so files from
+        # different products are transferred concurrently
+        if upload_s3 and self.s3_client:
+            with create_transfer_manager(self.s3_client, self._transfer_cfg) as transfer_manager:
+                self._process_products(products, transfer_manager)
+        else:
+            self._process_products(products, None)
         
         # Print summary
         self.print_summary()
@@ -391,12 +670,15 @@ class ProductOrganizer:
         logger.info("\n" + "=" * 70)
         logger.info("SUMMARY")
         logger.info("=" * 70)
-        logger.info(f"Total products:        {self.stats['total']}")
-        logger.info(f"Successfully processed: {self.stats['success']}")
-        logger.info(f"Failed:                {self.stats['failed']}")
+        with self._stats_lock:
+            stats = dict(self.stats)
+        
+        logger.info(f"Total products:        {stats['total']}")
+        logger.info(f"Successfully processed: {stats['success']}")
+        logger.info(f"Failed:                {stats['failed']}")
         
         if self.s3_client:
-            logger.info(f"Uploaded to S3:        {self.stats['uploaded']}")
+            logger.info(f"Uploaded to S3:        {stats['uploaded']}")
             logger.info(f"\nS3 Location: s3://{self.s3_bucket}/{self.s3_prefix}/")
         
         logger.info(f"\nLocal Output: {self.output_dir.absolute()}")